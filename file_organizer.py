@@ -9,12 +9,13 @@ Features:
 - Konfliktlösung (automatisches Umbenennen)
 - Konfigurierbare Regeln via JSON/YAML (optional)
 - Optional nach Datum (Jahr/Monat) einsortieren
+- Parallele Übertragung (Thread-Pool) ab 16 Dateien
 
 Beispiele:
     python file_organizer.py /Pfad/Quelle /Pfad/Ziel --mode move --recursive --dry-run
     python file_organizer.py ~/Downloads ~/Sortiert --mode move --rules rules.json
     python file_organizer.py ~/DL ~/Sortiert --mode copy --by-date
-    python file_organizer.py --undo manifest_2025-10-08T12-00-00.json
+    python file_organizer.py --undo manifest_2025-10-08T12-00-00.jsonl
 
 Regeldatei (JSON) Beispiel:
 {
@@ -54,19 +55,63 @@ Regeldatei (JSON) Beispiel:
 
 Hinweise:
 - Das Manifest erlaubt Undo: Verschobenes wird zurückverschoben, Kopiertes gelöscht.
+  Es wird als JSONL (ein Eintrag pro Zeile) während des Laufs geschrieben;
+  ältere Manifeste im JSON-Array-Format lassen sich weiterhin rückgängig machen.
+- Endungen ohne Regel werden über die eingebaute MIME-Tabelle (Bilder, Audio,
+  Videos, Text) zugeordnet; alles Weitere gehört in die Regeldatei.
 """
 from __future__ import annotations
 
 import argparse
 import datetime as dt
+import errno
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import hashlib
+import itertools
 import json
-import mimetypes
+import logging
+import multiprocessing
 import os
 from pathlib import Path
+import queue
 import shutil
 import sys
-from typing import Dict, List, Optional, Tuple
+import threading
+import time
+from typing import BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+
+# ---------------------- Optionale Beschleuniger ---------------------- #
+try:  # optional: BLAKE3 (SIMD) ist um ein Vielfaches schneller als SHA-256
+    from blake3 import blake3 as _hasher
+except ImportError:
+    _hasher = hashlib.sha256
+
+
+def _json_dumps_line(obj) -> bytes:
+    return json.dumps(obj, separators=(",", ":")).encode() + b"\n"
+
+
+try:  # optional: orjson (Rust) serialisiert/parst JSON deutlich schneller
+    import orjson
+
+    def _dumps_line(obj) -> bytes:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+        except orjson.JSONEncodeError:
+            # orjson lehnt Surrogate-Escapes ab, wie sie bei nicht UTF-8-
+            # kodierten Dateinamen entstehen; json schreibt sie als \udcXX
+            return _json_dumps_line(obj)
+
+    def _loads(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # \udcXX-Escapes (s. o.) kann nur json wieder einlesen
+            return json.loads(data)
+except ImportError:
+    _dumps_line = _json_dumps_line
+    _loads = json.loads
 
 
 # ---------------------- Standard-Regeln (Fallback) ---------------------- #
@@ -84,6 +129,32 @@ DEFAULT_RULES: Dict[str, str] = {
     ".zip": "Archive", ".rar": "Archive", ".7z": "Archive",
 }
 
+# MIME-Hauptyp -> Kategorie, wenn keine Regel greift
+MIME_CATEGORIES: Dict[str, str] = {"image": "Bilder", "audio": "Audio", "video": "Videos", "text": "Text"}
+# Endung -> MIME-Hauptyp, erst bei der ersten unbekannten Endung aufgebaut
+_EXT_TO_MAJOR: Optional[Dict[str, str]] = None
+
+# Monatsordner für --by-date ("01" … "12")
+MONTH_STR: Tuple[str, ...] = tuple(f"{m:02d}" for m in range(1, 13))
+
+# Unterhalb dieser Dateianzahl lohnt sich der Thread-Pool nicht
+PARALLEL_MIN_FILES = 16
+# Manifest-Zeilen (Bytes bzw. Sekunden), die ein Worker sammelt, bevor er sie schreibt
+MANIFEST_CHUNK_SIZE = 64 << 10
+MANIFEST_FLUSH_INTERVAL = 1.0
+# Maximale Anzahl geplanter, noch nicht übertragener Dateien
+PIPELINE_QUEUE_SIZE = 1024
+# Sekunden, nach denen wartende Pipeline-Threads auf Abbruch prüfen
+PIPELINE_POLL_INTERVAL = 0.1
+
+# Ab dieser Größe läuft der Duplikat-Vergleich in einem eigenen Prozess
+DEDUP_POOL_MIN_SIZE = 64 << 20
+
+log = logging.getLogger("file_organizer")
+
+_COMPARE_POOL: Optional[ProcessPoolExecutor] = None
+_COMPARE_POOL_LOCK = threading.Lock()
+
 # ---------------------- Hilfsfunktionen ---------------------- #
 
 def load_rules(path: Optional[Path]) -> Dict[str, str]:
@@ -91,80 +162,238 @@ def load_rules(path: Optional[Path]) -> Dict[str, str]:
         return DEFAULT_RULES.copy()
     if not path.exists():
         raise FileNotFoundError(f"Regeldatei nicht gefunden: {path}")
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    # Normalisiere Keys zu .ext Kleinbuchstaben
+    data = _loads(path.read_bytes())
+    # Normalisiere Keys zu .ext Kleinbuchstaben; interniert, damit jede Kategorie
+    # nur einmal im Speicher liegt und Lookups per Zeigervergleich treffen
     rules: Dict[str, str] = {}
     for k, v in data.items():
         if not k.startswith("."):
             k = "." + k
-        rules[k.lower()] = str(v)
+        rules[sys.intern(k.lower())] = sys.intern(str(v))
     return rules
 
 
+_BUF = threading.local()
+
+
+def _get_bufs(size: int) -> Tuple[bytearray, bytearray]:
+    """Zwei Lesepuffer pro Thread, die über alle Dateien wiederverwendet werden."""
+    bufs = getattr(_BUF, "bufs", None)
+    if bufs is None or len(bufs[0]) != size:
+        bufs = (bytearray(size), bytearray(size))
+        _BUF.bufs = bufs
+    return bufs
+
+
 def hash_file(path: Path, chunk_size: int = 1 << 20) -> str:
-    sha = hashlib.sha256()
-    with open(path, "rb") as f:
+    h = _hasher()
+    mv = memoryview(_get_bufs(chunk_size)[0])
+    with open(path, "rb", buffering=0) as f:
+        while n := f.readinto(mv):
+            h.update(mv[:n])
+    return h.hexdigest()[:12]
+
+
+def _files_equal(a: Union[str, Path], b: Union[str, Path], bufsize: int = 1 << 20) -> bool:
+    """Byteweiser Vergleich, bricht beim ersten abweichenden Block ab."""
+    buf_a, buf_b = _get_bufs(bufsize)
+    with open(a, "rb", buffering=0) as fa, open(b, "rb", buffering=0) as fb:
         while True:
-            chunk = f.read(chunk_size)
-            if not chunk:
-                break
-            sha.update(chunk)
-    return sha.hexdigest()[:12]
-
-
-def infer_category(p: Path, rules: Dict[str, str]) -> str:
-    ext = p.suffix.lower()
-    if ext in rules:
-        return rules[ext]
-    # Fallback via MIME-Typ
-    mime, _ = mimetypes.guess_type(str(p))
-    if mime:
-        major = mime.split("/", 1)[0]
-        mapping = {"image": "Bilder", "audio": "Audio", "video": "Videos", "text": "Text"}
-        if major in mapping:
-            return mapping[major]
-    return "Sonstiges"
+            n_a = fa.readinto(buf_a)
+            n_b = fb.readinto(buf_b)
+            if n_a != n_b:
+                return False
+            # bytearray-Vergleich ist ein memcmp; memoryview-Slices würden
+            # elementweise (und unter dem GIL) verglichen
+            if n_a == bufsize:
+                if buf_a != buf_b:
+                    return False
+                continue
+            return buf_a[:n_a] == buf_b[:n_b]
+
+
+def _compare_pool() -> ProcessPoolExecutor:
+    """Prozess-Pool für große Duplikat-Vergleiche, erst bei Bedarf gestartet."""
+    global _COMPARE_POOL
+    with _COMPARE_POOL_LOCK:
+        if _COMPARE_POOL is None:
+            # spawn statt fork: der Aufrufer hat bereits laufende Worker-Threads
+            _COMPARE_POOL = ProcessPoolExecutor(
+                max_workers=os.cpu_count(), mp_context=multiprocessing.get_context("spawn")
+            )
+        return _COMPARE_POOL
+
+
+def _shutdown_compare_pool() -> None:
+    global _COMPARE_POOL
+    with _COMPARE_POOL_LOCK:
+        if _COMPARE_POOL is not None:
+            _COMPARE_POOL.shutdown()
+            _COMPARE_POOL = None
+
+
+def _mime_major(ext: str) -> Optional[str]:
+    global _EXT_TO_MAJOR
+    if _EXT_TO_MAJOR is None:
+        # mimetypes nur laden, wenn eine Endung keine Regel hat; genutzt wird die
+        # eingebaute Tabelle ohne init(), also ohne /etc/mime.types bzw. Registry
+        import mimetypes
+        _EXT_TO_MAJOR = {e: mt.split("/", 1)[0] for e, mt in mimetypes.types_map.items()}
+    return _EXT_TO_MAJOR.get(ext)
+
+
+def infer_category(p: Union[str, Path], rules: Dict[str, str]) -> str:
+    ext = sys.intern(os.path.splitext(p)[1].lower())
+    category = rules.get(ext)
+    if category is not None:
+        return category
+    # Fallback via MIME-Hauptyp der Endung
+    return MIME_CATEGORIES.get(_mime_major(ext), "Sonstiges")
 
 
 def build_target_path(
-    src_file: Path,
-    dest_root: Path,
+    src_file: Union[str, Path],
+    dest_root: Union[str, Path],
     category: str,
     by_date: bool,
-) -> Path:
-    parts = [dest_root, Path(category)]
+    stat: Optional[os.stat_result] = None,
+    created: Optional[set] = None,
+) -> str:
     if by_date:
         try:
-            mtime = dt.datetime.fromtimestamp(src_file.stat().st_mtime)
+            # Vorhandenes stat-Ergebnis wiederverwenden statt erneut zu stat'en
+            tm = time.localtime((stat or os.stat(src_file)).st_mtime)
         except Exception:
-            mtime = dt.datetime.now()
-        parts.extend([Path(str(mtime.year)), Path(f"{mtime.month:02d}")])
-    target_dir = Path(*parts)
-    target_dir.mkdir(parents=True, exist_ok=True)
-    return target_dir / src_file.name
+            tm = time.localtime()
+        target_dir = os.path.join(dest_root, category, str(tm.tm_year), MONTH_STR[tm.tm_mon - 1])
+    else:
+        target_dir = os.path.join(dest_root, category)
+    # `created`: bereits angelegte Ordner dieses Laufs – spart ein mkdir pro Datei
+    if created is None or target_dir not in created:
+        os.makedirs(target_dir, exist_ok=True)
+        if created is not None:
+            created.add(target_dir)
+    return os.path.join(target_dir, os.path.basename(src_file))
 
 
-def resolve_conflict(target: Path, strategy: str = "rename") -> Path:
-    if not target.exists():
+def _entry_stat(entry: os.DirEntry) -> Optional[os.stat_result]:
+    try:
+        return entry.stat()  # gecacht im DirEntry; bei Links die Zieldatei
+    except OSError:
+        return None
+
+
+def _claim(path: str) -> bool:
+    """Legt `path` atomar als leeren Platzhalter an; False, falls schon vorhanden."""
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    except FileExistsError:
+        return False
+    os.close(fd)
+    return True
+
+
+def resolve_conflict(
+    target: Union[str, Path],
+    strategy: str = "rename",
+    claim: Optional[Callable[[str], bool]] = None,
+) -> str:
+    target = os.fspath(target)
+    # lexists: auch defekte Symlinks belegen einen Namen (O_EXCL scheitert daran)
+    exists = os.path.lexists
+    # `claim` (z. B. _claim) reserviert den gefundenen Namen atomar (parallele Worker)
+    if not exists(target) and (claim is None or claim(target)):
         return target
     if strategy == "skip":
         return target  # Caller muss dann skippen
-    stem, suffix = target.stem, target.suffix
-    parent = target.parent
-    i = 1
+    base, suffix = os.path.splitext(target)
+
+    def candidate(i: int) -> str:
+        return f"{base} ({i}){suffix}"
+
+    lo = 0  # alle Indizes bis einschließlich lo gelten als belegt
     while True:
-        candidate = parent / f"{stem} ({i}){suffix}"
-        if not candidate.exists():
-            return candidate
-        i += 1
+        # Exponentiell bis zum ersten freien Index, dann binär zurück –
+        # O(log n) statt O(n) stat-Aufrufe bei vielen "name (n)"-Dateien
+        hi = max(1, lo * 2)
+        while exists(candidate(hi)):
+            lo, hi = hi, hi * 2
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if exists(candidate(mid)):
+                lo = mid
+            else:
+                hi = mid
+        free = candidate(hi)
+        if claim is None or claim(free):
+            return free
+        # Inzwischen belegt: ab hier weitersuchen statt denselben Index erneut zu prüfen
+        lo = hi
+
+
+_USE_SENDFILE = sys.platform.startswith("linux") and hasattr(os, "sendfile") and hasattr(os, "posix_fadvise")
+
 
+def _copy_sendfile(src: str, dst: str) -> None:
+    """Kopiert per sendfile und gibt den Page-Cache danach wieder frei (Linux).
 
-def move_or_copy(src: Path, dst: Path, mode: str) -> None:
+    Die kopierten Daten werden nicht erneut gelesen; ohne DONTNEED würden sie
+    bei großen Läufen den Cache verdrängen.
+    """
+    with open(src, "rb", buffering=0) as fsrc, open(dst, "wb", buffering=0) as fdst:
+        in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+        os.posix_fadvise(in_fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        offset = 0
+        while True:
+            try:
+                sent = os.sendfile(out_fd, in_fd, offset, 1 << 30)
+            except OSError as e:
+                # z. B. Dateisysteme ohne sendfile-Unterstützung
+                if offset == 0 and e.errno in (errno.EINVAL, errno.ENOSYS, errno.ENOTSUP):
+                    break
+                raise
+            if sent == 0:
+                os.posix_fadvise(in_fd, 0, 0, os.POSIX_FADV_DONTNEED)
+                os.posix_fadvise(out_fd, 0, 0, os.POSIX_FADV_DONTNEED)
+                return
+            offset += sent
+    shutil.copyfile(src, dst)
+
+
+def _copy_file(src: str, dst: str) -> None:
+    if _USE_SENDFILE:
+        _copy_sendfile(src, dst)
+    else:
+        # copyfile nutzt die Plattform-Schnellpfade (fcopyfile, CopyFile2)
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
+def move_or_copy(src: Union[str, Path], dst: Union[str, Path], mode: str) -> None:
+    src_s, dst_s = os.fspath(src), os.fspath(dst)
     if mode == "move":
-        shutil.move(str(src), str(dst))
+        try:
+            os.replace(src_s, dst_s)
+            return
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+        # Anderes Dateisystem: kopieren, dann Quelle löschen
+        if os.path.islink(src_s):
+            # Symlink als Link neu anlegen (ersetzt den Platzhalter)
+            os.unlink(dst_s)
+            os.symlink(os.readlink(src_s), dst_s)
+            os.unlink(src_s)
+            return
+        try:
+            _copy_file(src_s, dst_s)
+        except BaseException:
+            if os.path.exists(dst_s):
+                os.unlink(dst_s)
+            raise
+        os.unlink(src_s)
     elif mode == "copy":
-        shutil.copy2(str(src), str(dst))
+        _copy_file(src_s, dst_s)
     else:
         raise ValueError("mode muss 'move' oder 'copy' sein")
 
@@ -173,23 +402,30 @@ def move_or_copy(src: Path, dst: Path, mode: str) -> None:
 
 def manifest_filename(prefix: str = "manifest") -> str:
     ts = dt.datetime.now().strftime("%Y-%m-%dT%H-%M-%S")
-    return f"{prefix}_{ts}.json"
+    return f"{prefix}_{ts}.jsonl"
 
 
-def write_manifest(path: Path, records: List[Dict]) -> None:
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(records, f, ensure_ascii=False, indent=2)
+def open_manifest(path: Path) -> BinaryIO:
+    # Eine kompakte JSON-Zeile pro Eintrag (JSONL); ein write() ist threadsicher
+    return open(path, "wb", buffering=1 << 20)
 
 
-def read_manifest(path: Path) -> List[Dict]:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+def read_manifest(path: Path) -> Iterator[Dict]:
+    with open(path, "rb") as f:
+        if f.read(1) == b"[":
+            # Altes Format: ein einziges JSON-Array
+            f.seek(0)
+            yield from _loads(f.read())
+            return
+        f.seek(0)
+        for line in f:
+            if line.strip():
+                yield _loads(line)
 
 
 def undo_from_manifest(manifest_path: Path, verbose: bool = True) -> None:
-    records = read_manifest(manifest_path)
     errors = 0
-    for rec in records:
+    for rec in read_manifest(manifest_path):
         action = rec.get("action")
         src = Path(rec.get("src"))
         dst = Path(rec.get("dst"))
@@ -200,15 +436,15 @@ def undo_from_manifest(manifest_path: Path, verbose: bool = True) -> None:
             continue
         try:
             if mode == "move":
-                # zurückverschieben, falls vorhanden
-                if dst.exists():
+                # zurückverschieben, falls vorhanden (lexists: auch verschobene Symlinks)
+                if os.path.lexists(dst):
                     dst.parent.mkdir(parents=True, exist_ok=True)
                     shutil.move(str(dst), str(src))
                 else:
                     print(f"[WARN] Ziel fehlt, kann nicht zurückbewegen: {dst}")
             elif mode == "copy":
                 # Kopie löschen
-                if dst.exists():
+                if os.path.lexists(dst):
                     dst.unlink()
                 else:
                     print(f"[WARN] Kopie fehlt, kann nicht löschen: {dst}")
@@ -226,11 +462,153 @@ def undo_from_manifest(manifest_path: Path, verbose: bool = True) -> None:
 
 # ---------------------- Hauptlogik ---------------------- #
 
-def collect_files(root: Path, recursive: bool) -> List[Path]:
-    if recursive:
-        return [p for p in root.rglob("*") if p.is_file()]
-    else:
-        return [p for p in root.glob("*") if p.is_file()]
+def _iter_files(root: Union[str, Path], recursive: bool, skip: Optional[str] = None) -> Iterator[Tuple[str, os.DirEntry]]:
+    """Liefert (Pfad, DirEntry) aller Dateien lazy via os.scandir.
+
+    is_file()/is_dir() nutzen den d_type aus readdir, es entsteht also kein
+    zusätzlicher stat-Aufruf pro Eintrag (außer für Symlinks). `skip` (z. B.
+    der Zielordner, wenn er in der Quelle liegt) wird nicht betreten.
+    """
+    try:
+        it = os.scandir(root)
+    except PermissionError:
+        return
+    with it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                if recursive and entry.path != skip:
+                    yield from _iter_files(entry.path, recursive, skip)
+            elif entry.is_file(follow_symlinks=False) or (entry.is_symlink() and entry.is_file()):
+                # Symlinks auf Dateien werden (als Link) mit einsortiert, Links
+                # auf Ordner nicht betreten, defekte Links übersprungen
+                yield entry.path, entry
+
+
+def _default_workers() -> int:
+    return min(32, (os.cpu_count() or 1) * 4)
+
+
+# liefert die Queue eines Workers, solange keine Arbeit ansteht
+_IDLE = object()
+
+
+def _drain(items, work, mf: Optional[BinaryIO]) -> int:
+    """Arbeitet `items` mit `work` ab, schreibt die Manifest-Einträge nach `mf` und zählt sie.
+
+    Jeder Aufrufer (Thread) sammelt seine Zeilen in einem eigenen Puffer und
+    schreibt ihn gebündelt: nach MANIFEST_CHUNK_SIZE Bytes, nach
+    MANIFEST_FLUSH_INTERVAL Sekunden (geprüft zwischen zwei Dateien) und sobald
+    `items` mit _IDLE meldet, dass der Worker auf Arbeit wartet – so bleibt auch
+    bei einem harten Abbruch nur wenig ohne Undo-Eintrag.
+    """
+    count = 0
+    chunk = bytearray()
+    unwritten: List[Dict] = []
+    last_flush = time.monotonic()
+
+    def flush() -> None:
+        nonlocal last_flush
+        try:
+            mf.write(chunk)
+            mf.flush()
+        except OSError as e:
+            # Ohne Manifest kein Undo: betroffene Transfers nennen und abbrechen
+            log.error(f"[ERROR] Manifest konnte nicht geschrieben werden: {e}")
+            for rec in unwritten:
+                log.error(f"[ERROR] Ohne Undo-Eintrag: {rec['src']} -> {rec['dst']}")
+            raise
+        finally:
+            chunk.clear()
+            unwritten.clear()
+        last_flush = time.monotonic()
+
+    try:
+        for item in items:
+            if item is _IDLE:
+                if chunk:
+                    flush()
+                continue
+            rec = None
+            try:
+                rec = work(*item)
+                if rec is None:
+                    continue
+                line = _dumps_line(rec)
+            except Exception as e:
+                log.error(f"[ERROR] Verarbeitung fehlgeschlagen: {item[0]}: {e}")
+                if rec is not None:
+                    log.error(f"[ERROR] Ohne Undo-Eintrag: {rec['src']} -> {rec['dst']}")
+                continue
+            chunk += line
+            unwritten.append(rec)
+            count += 1
+            if len(chunk) >= MANIFEST_CHUNK_SIZE or time.monotonic() - last_flush >= MANIFEST_FLUSH_INTERVAL:
+                flush()
+    finally:
+        if chunk:
+            flush()
+    return count
+
+
+def _run_pipeline(items, work, mf: Optional[BinaryIO], workers: int) -> int:
+    """Producer/Consumer: ein Thread plant (Traversierung), `workers` Threads übertragen.
+
+    Bricht ein Thread mit einem Fehler ab oder kommt Strg+C, wird `cancel`
+    gesetzt: Producer und Consumer hören nach der laufenden Datei auf, statt
+    auf die Queue zu warten. Der erste Fehler wird danach weitergereicht.
+    """
+    q: queue.Queue = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    stop = object()
+    cancel = threading.Event()
+
+    def put(item) -> bool:
+        while not cancel.is_set():
+            try:
+                q.put(item, timeout=PIPELINE_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def get():
+        if cancel.is_set():
+            return stop
+        try:
+            return q.get(timeout=PIPELINE_POLL_INTERVAL)
+        except queue.Empty:
+            # Leerlauf: dem Worker Gelegenheit geben, sein Manifest zu schreiben
+            return _IDLE
+
+    def cancel_on_error(fn, *args):
+        try:
+            return fn(*args)
+        except BaseException:
+            cancel.set()
+            raise
+
+    def produce() -> None:
+        try:
+            for item in items:
+                if not put(item):
+                    return
+        finally:
+            for _ in range(workers):
+                put(stop)
+
+    with ThreadPoolExecutor(max_workers=workers + 1) as pool:
+        try:
+            producer = pool.submit(cancel_on_error, produce)
+            consumers = [
+                pool.submit(cancel_on_error, _drain, iter(get, stop), work, mf) for _ in range(workers)
+            ]
+            count = sum(c.result() for c in consumers)
+            producer.result()  # Fehler der Traversierung weiterreichen
+        except BaseException:
+            # z. B. KeyboardInterrupt im Hauptthread: Worker beenden die laufende
+            # Datei, schreiben ihre Manifest-Einträge und hören dann auf
+            cancel.set()
+            raise
+    return count
 
 
 def organize(
@@ -243,6 +621,7 @@ def organize(
     by_date: bool = False,
     conflict: str = "rename",  # oder "skip"
     write_manifest_to: Optional[Path] = None,
+    workers: Optional[int] = None,
 ) -> Path:
     if mode not in {"move", "copy"}:
         raise ValueError("mode muss 'move' oder 'copy' sein")
@@ -250,62 +629,163 @@ def organize(
         raise ValueError("conflict muss 'rename' oder 'skip' sein")
 
     rules = load_rules(rules_path)
-    files = collect_files(source, recursive)
+    total = 0
+    # Wurzeln einmal auflösen: alle Pfade darunter sind damit bereits absolut
+    # und kanonisch, im Manifest ist kein resolve() pro Datei nötig
+    source = Path(source).resolve()
+    dest = Path(dest).resolve()
 
-    manifest_records: List[Dict] = []
-    transfers = 0
+    if write_manifest_to is None:
+        write_manifest_to = dest / manifest_filename()
+    dest_s = os.fspath(dest)
+    manifest_s = os.fspath(write_manifest_to.resolve())
 
-    for f in files:
-        category = infer_category(f, rules)
-        target = build_target_path(f, dest, category, by_date)
+    # Nur der planende Thread legt Ordner an, daher ohne Lock
+    created_dirs: set = set()
 
-        final_target = target
-        if final_target.exists():
-            # Prüfe Duplikate via Größe + Hash (leichtgewichtige Heuristik)
-            try:
-                if f.stat().st_size == final_target.stat().st_size:
-                    # Wenn gleiche Größe, optional Hash vergleichen
-                    if hash_file(f) == hash_file(final_target):
-                        # identische Datei – überspringen
-                        print(f"[SKIP] Duplikat erkannt: {f} == {final_target}")
-                        continue
-            except Exception:
-                pass
-            if conflict == "skip":
-                print(f"[SKIP] Existiert bereits: {final_target}")
+    def plan():
+        nonlocal total
+        # das eigene, gerade geschriebene Manifest auslassen
+        for path, entry in _iter_files(source, recursive, skip=dest_s):
+            if path == manifest_s:
                 continue
-            final_target = resolve_conflict(final_target, strategy="rename")
-
-        print(f"[PLAN] {mode.upper()} {f} -> {final_target}")
-        if not dry_run:
+            total += 1
+            category = infer_category(path, rules)
+            st = _entry_stat(entry) if by_date else None
+            yield path, entry, category, build_target_path(path, dest_s, category, by_date, st, created_dirs)
+
+    # Platzhalter, die dieser Lauf per O_EXCL angelegt hat und die noch nicht
+    # fertig geschrieben sind; das Event wird gesetzt, sobald das Ziel fertig ist
+    in_flight: Dict[str, threading.Event] = {}
+    in_flight_lock = threading.Lock()
+
+    def claim(path: str) -> bool:
+        # Nur die Buchführung unter dem Lock – das os.open läuft parallel
+        done = threading.Event()
+        with in_flight_lock:
+            if path in in_flight:
+                return False
+            in_flight[path] = done
+        if _claim(path):
+            return True
+        with in_flight_lock:
+            del in_flight[path]
+        done.set()
+        return False
+
+    def release(path: str) -> None:
+        with in_flight_lock:
+            done = in_flight.pop(path, None)
+        if done is not None:
+            done.set()
+
+    def wait_written(path: str) -> None:
+        with in_flight_lock:
+            done = in_flight.get(path)
+        if done is not None:
+            done.wait()
+
+    def transfer_one(f: str, entry: os.DirEntry, category: str, target: str) -> Optional[Dict]:
+        held = None
+        final_target = target
+        transferred = False
+        try:
+            while True:
+                # Ziel per O_EXCL-Platzhalter reservieren, damit kein anderer Worker es belegt
+                if not dry_run and claim(target):
+                    held = target
+                    existed = False
+                    break
+                # Ein Platzhalter dieses Laufs ist noch leer: erst vergleichen,
+                # wenn der andere Worker fertig geschrieben hat
+                wait_written(target)
+                try:
+                    tgt_st: Optional[os.stat_result] = os.stat(target)
+                except FileNotFoundError:
+                    tgt_st = None
+                existed = tgt_st is not None or os.path.lexists(target)
+                # Ist der andere Worker gescheitert, wurde sein Platzhalter wieder
+                # entfernt – dann das Ziel erneut zu reservieren versuchen
+                if existed or dry_run:
+                    break
+
+            if existed:
+                # Prüfe Duplikate via Größe + Inhalt
+                try:
+                    size = entry.stat().st_size
+                    if tgt_st is not None and size == tgt_st.st_size:
+                        # Wenn gleiche Größe, Inhalt blockweise vergleichen – große
+                        # Dateien in einem eigenen Prozess, damit der GIL frei bleibt
+                        if size >= DEDUP_POOL_MIN_SIZE:
+                            equal = _compare_pool().submit(_files_equal, f, target).result()
+                        else:
+                            equal = _files_equal(f, target)
+                        if equal:
+                            # identische Datei – überspringen
+                            log.info(f"[SKIP] Duplikat erkannt: {f} == {target}")
+                            return None
+                except Exception:
+                    pass
+                if conflict == "skip":
+                    log.info(f"[SKIP] Existiert bereits: {target}")
+                    return None
+                final_target = resolve_conflict(target, strategy="rename", claim=None if dry_run else claim)
+                if not dry_run:
+                    held = final_target
+
+            log.info(f"[PLAN] {mode.upper()} {f} -> {final_target}")
+            if dry_run:
+                return None
             try:
+                # Überschreibt den leeren Platzhalter
                 move_or_copy(f, final_target, mode)
-                transfers += 1
-                manifest_records.append({
-                    "action": "transfer",
-                    "mode": mode,
-                    "src": str(f.resolve()),
-                    "dst": str(final_target.resolve()),
-                    "category": category,
-                    "by_date": by_date,
-                    "dst_existed": target.exists(),
-                })
             except Exception as e:
-                print(f"[ERROR] Übertragung fehlgeschlagen: {f} -> {final_target}: {e}")
+                log.error(f"[ERROR] Übertragung fehlgeschlagen: {f} -> {final_target}: {e}")
+                return None
+            transferred = True
+        finally:
+            if held is not None:
+                if not transferred:
+                    try:
+                        os.unlink(held)  # Platzhalter wieder freigeben
+                    except OSError:
+                        pass
+                release(held)
+        return {
+            "action": "transfer",
+            "mode": mode,
+            "src": f,
+            "dst": final_target,
+            "category": category,
+            "by_date": by_date,
+            "dst_existed": existed,
+        }
+
+    # Manifest von Beginn an offen: die Worker hängen ihre Einträge blockweise an
+    # und schreiben den Rest auch bei Fehlern, damit jeder Lauf rückgängig zu machen ist
+    mf = None if dry_run else open_manifest(write_manifest_to)
 
-    if write_manifest_to is None:
-        write_manifest_to = dest / manifest_filename()
+    try:
+        items = plan()
+        head = list(itertools.islice(items, PARALLEL_MIN_FILES))
+        if len(head) < PARALLEL_MIN_FILES:
+            # Wenige Dateien: seriell, ohne Pool-Overhead
+            transfers = _drain(head, transfer_one, mf)
+        else:
+            transfers = _run_pipeline(
+                itertools.chain(head, items), transfer_one, mf, workers or _default_workers()
+            )
+    finally:
+        if mf is not None:
+            mf.close()
+        _shutdown_compare_pool()
 
     if not dry_run:
-        try:
-            write_manifest(write_manifest_to, manifest_records)
-            print(f"[OK] Manifest geschrieben: {write_manifest_to} ({len(manifest_records)} Einträge)")
-        except Exception as e:
-            print(f"[WARN] Konnte Manifest nicht schreiben: {e}")
+        log.info(f"[OK] Manifest geschrieben: {write_manifest_to} ({transfers} Einträge)")
     else:
-        print("[INFO] Dry-Run: keine Änderungen durchgeführt, kein Manifest geschrieben.")
+        log.info("[INFO] Dry-Run: keine Änderungen durchgeführt, kein Manifest geschrieben.")
 
-    print(f"[DONE] Geplante/ausgeführte Transfers: {transfers} von {len(files)} Dateien")
+    log.info(f"[DONE] Geplante/ausgeführte Transfers: {transfers} von {total} Dateien")
     return write_manifest_to
 
 
@@ -325,6 +805,7 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     p.add_argument("--by-date", action="store_true", help="zusätzlich nach Jahr/Monat ablegen")
     p.add_argument("--conflict", choices=["rename", "skip"], default="rename", help="Konfliktstrategie bei vorhandenen Dateien")
     p.add_argument("--manifest-out", type=str, help="Pfad/Dateiname für Manifest")
+    p.add_argument("--workers", type=int, help="Anzahl paralleler Übertragungen (Standard: min(32, 4 × CPUs))")
 
     args = p.parse_args(argv)
 
@@ -334,12 +815,16 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
 
     if not args.source or not args.dest:
         p.error("Bitte Quelle und Ziel angeben (oder --undo verwenden).")
+    if args.workers is not None and args.workers < 1:
+        p.error("--workers muss mindestens 1 sein.")
 
     return args
 
 
 def main(argv: Optional[List[str]] = None) -> int:
     args = parse_args(argv)
+    # Logging statt print: Handler serialisiert die Ausgaben der Worker-Threads
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
 
     if args.undo:
         mpath = Path(args.undo)
@@ -371,12 +856,16 @@ def main(argv: Optional[List[str]] = None) -> int:
             by_date=args.by_date,
             conflict=args.conflict,
             write_manifest_to=manifest_out,
+            workers=args.workers,
         )
         if args.dry_run:
             print("Dry-Run abgeschlossen. Wenn es gut aussieht, entferne --dry-run.")
         else:
             print(f"Fertig. Manifest unter: {manifest_path}")
         return 0
+    except KeyboardInterrupt:
+        print("Abgebrochen. Bereits übertragene Dateien stehen im Manifest.")
+        return 130
     except Exception as e:
         print(f"Fehler: {e}")
         return 1